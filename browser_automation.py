@@ -1,24 +1,53 @@
 import os
-import time
+import logging
 import random
-from typing import Dict, Any, Optional, List, Union
+import functools
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dotenv import load_dotenv
 import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+from config import CONFIG
+from http_automation import _CRIME_SUCCESS_RE, _GYM_SUCCESS_RE, _ITEM_SUCCESS_RE, _EDUCATION_SUCCESS_RE
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=256)
+def _id_locator(prefix: str, key: str):
+    """Build (and cache) the locator for an element whose id is prefix + key"""
+    # By.ID maps to getElementById, which skips the CSS selector parser
+    return (By.ID, f"{prefix}{key}")
+
 class TornBrowser:
     """
     A class to handle browser automation for Torn
     """
     
-    def __init__(self, headless: bool = False):
+    # Static locators, built once at class load
+    _LOC_PLAYER = (By.ID, "player")
+    _LOC_PASSWORD = (By.ID, "password")
+    _LOC_LOGIN_SUBMIT = (By.CSS_SELECTOR, "input[type='submit']")
+    _LOC_USER_INFO = (By.CSS_SELECTOR, ".user-info")
+    _LOC_POPUP_CLOSE = (By.CSS_SELECTOR, ".popup-info .close-icon")
+    _LOC_CONTENT_TITLE = (By.CSS_SELECTOR, ".content-title")
+    _LOC_SUBMIT_CRIME = (By.CSS_SELECTOR, ".submit-crime")
+    _LOC_TRAIN_SUBMIT = (By.CSS_SELECTOR, ".train-submit")
+    _LOC_USE_ITEM = (By.CSS_SELECTOR, ".use-item")
+    _LOC_EDUCATION_ACTIVE = (By.CSS_SELECTOR, ".education-active")
+    _LOC_START_EDUCATION = (By.CSS_SELECTOR, ".start-education")
+    
+    # Reads the action result in one command; null until the message has text
+    _JS_RESULT_TEXT = "var e = document.querySelector('.msg'); return e && e.innerText ? e.innerText : null;"
+    
+    def __init__(self, headless: bool = True):
         """
         Initialize the TornBrowser class
         
@@ -37,6 +66,7 @@ class TornBrowser:
             raise ValueError("Username and password are required for browser automation. Set them in .env file.")
         
         # Initialize browser
+        self.headless = headless
         self.driver = self._initialize_browser(headless)
         self.logged_in = False
     
@@ -62,15 +92,74 @@ class TornBrowser:
         options.add_argument("--disable-notifications")
         options.add_argument("--disable-infobars")
         
+        # Skip images and notification prompts; actions only need the DOM
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
+        # Return from driver.get() at DOMContentLoaded instead of the full load event
+        options.page_load_strategy = "eager"
+        
         # Add user agent to avoid detection
         options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
         
-        # Create browser instance
-        driver = webdriver.Chrome(options=options)
+        # Create browser instance, keeping one persistent HTTP connection to chromedriver
+        service = ChromeService()
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        self._widen_command_pool(driver)
         driver.set_window_size(1366, 768)
         
         return driver
     
+    def _widen_command_pool(self, driver: webdriver.Chrome, maxsize: int = 20):
+        """
+        Let the WebDriver client keep several connections to chromedriver open
+        
+        Selenium's RemoteConnection creates its urllib3 PoolManager with the
+        default maxsize of 1, which serializes overlapping commands and logs
+        "connection pool is full" warnings. The pinned Selenium version has no
+        ClientConfig to change that, so the pool settings are updated in place.
+        
+        Args:
+            driver: WebDriver whose command connection should be widened
+            maxsize: Number of connections to keep per pool
+        """
+        pool_manager = getattr(driver.command_executor, "_conn", None)
+        if pool_manager is None:
+            return
+        
+        pool_manager.connection_pool_kw["maxsize"] = maxsize
+        # Drop the pool created for the session handshake so the next command uses the new size
+        pool_manager.clear()
+    
+    def is_alive(self) -> bool:
+        """
+        Check whether the WebDriver session is still usable
+        
+        Returns:
+            True if the driver responds to commands, False otherwise
+        """
+        if self.driver is None or self.driver.session_id is None:
+            return False
+        
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def restart(self):
+        """Tear down the WebDriver and start a fresh, logged-out one"""
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+        
+        self.driver = self._initialize_browser(self.headless)
+        self.logged_in = False
+    
     def login(self) -> bool:
         """
         Log in to Torn
@@ -79,56 +168,109 @@ class TornBrowser:
             True if login successful, False otherwise
         """
         if self.logged_in:
-            print("Already logged in.")
             return True
         
         try:
-            print("Logging in to Torn...")
+            # Reuse an existing session instead of logging in again; Torn also gives
+            # anonymous visitors a PHPSESSID, so only trust it on a logged-in page
+            if self.driver.get_cookie("PHPSESSID") and self.driver.find_elements(*self._LOC_USER_INFO):
+                self.logged_in = True
+                return True
+            
+            logger.info("Logging in to Torn...")
             
             # Navigate to login page
             self.driver.get(f"{self.base_url}/login")
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "player"))
-            )
-            
-            # Enter username and password
-            self.driver.find_element(By.ID, "player").send_keys(self.username)
-            self.driver.find_element(By.ID, "password").send_keys(self.password)
+            # Wait for page to load and enter username and password
+            self._wait(self._LOC_PLAYER).send_keys(self.username)
+            self.driver.find_element(*self._LOC_PASSWORD).send_keys(self.password)
             
             # Click login button
-            self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']").click()
+            self.driver.find_element(*self._LOC_LOGIN_SUBMIT).click()
             
             # Wait for login to complete
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".user-info"))
-            )
+            self._wait(self._LOC_USER_INFO)
             
             self.logged_in = True
-            print("Login successful.")
+            logger.info("Login successful.")
             
             # Handle any popups
             self._handle_popups()
             
             return True
         except Exception as e:
-            print(f"Login failed: {str(e)}")
+            logger.warning("Login failed: %s", e)
             return False
     
+    def _wait(self, locator: Tuple[str, str], timeout: float = 10):
+        """
+        Wait for an element to be present, polling every 50ms
+        
+        Args:
+            locator: (By strategy, selector) tuple of the element
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The located element
+        """
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+            EC.presence_of_element_located(locator)
+        )
+    
+    def _read_result(self, timeout: float = 10) -> str:
+        """
+        Wait for the action result message and return its text
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            The result message
+        """
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+            lambda driver: driver.execute_script(self._JS_RESULT_TEXT)
+        )
+    
+    def _open(self, path: str):
+        """
+        Navigate to a page and wait for it to load, logging in again if the
+        session expired and Torn redirected to the login page
+        
+        Args:
+            path: Page path relative to the base URL
+        """
+        self.driver.get(f"{self.base_url}{path}")
+        # get() has already followed any redirect, so there is no need to wait for the page
+        if "/login" not in self.driver.current_url:
+            self._wait(self._LOC_CONTENT_TITLE)
+            return
+        
+        logger.warning("Session expired.")
+        self.logged_in = False
+        # Drop the stale session cookie so login() does not trust it
+        self.driver.delete_all_cookies()
+        if not self.login():
+            raise WebDriverException("Could not log in again after the session expired")
+        
+        self.driver.get(f"{self.base_url}{path}")
+        self._wait(self._LOC_CONTENT_TITLE)
+    
     def _handle_popups(self):
         """Handle any popups that appear after login"""
         try:
-            # Wait a moment for popups to appear
-            time.sleep(2)
+            # Give popups up to 2 seconds to appear, returning as soon as they do
+            popups = WebDriverWait(self.driver, 2, poll_frequency=0.3).until(
+                EC.presence_of_all_elements_located(self._LOC_POPUP_CLOSE)
+            )
             
             # Close any popups (adjust selectors as needed)
-            popups = self.driver.find_elements(By.CSS_SELECTOR, ".popup-info .close-icon")
             for popup in popups:
                 popup.click()
-                time.sleep(0.5)
+        except TimeoutException:
+            pass
         except Exception as e:
-            print(f"Error handling popups: {str(e)}")
+            logger.error("Error handling popups: %s", e)
     
     def commit_crime(self, crime_id: str) -> bool:
         """
@@ -144,46 +286,29 @@ class TornBrowser:
             return False
         
         try:
-            print(f"Committing crime {crime_id}...")
-            
-            # Navigate to crimes page
-            self.driver.get(f"{self.base_url}/crimes.php")
+            logger.info("Committing crime %s...", crime_id)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".content-title"))
-            )
+            # Navigate to crimes page and wait for it to load
+            self._open("/crimes.php")
             
             # Find and click on the crime
-            crime_element = self.driver.find_element(By.CSS_SELECTOR, f"#crime{crime_id}")
+            crime_element = self.driver.find_element(*_id_locator("crime", crime_id))
             crime_element.click()
             
-            # Wait for crime form to appear
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".submit-crime"))
-            )
-            
-            # Click the submit button
-            submit_button = self.driver.find_element(By.CSS_SELECTOR, ".submit-crime")
-            submit_button.click()
+            # Wait for crime form to appear and click the submit button
+            self._wait(self._LOC_SUBMIT_CRIME).click()
             
-            # Wait for result
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".msg"))
-            )
-            
-            # Check result
-            result_element = self.driver.find_element(By.CSS_SELECTOR, ".msg")
-            result_text = result_element.text
+            # Wait for result and check it
+            result_text = self._read_result()
             
-            if "success" in result_text.lower():
-                print("Crime successful!")
+            if _CRIME_SUCCESS_RE.search(result_text):
+                logger.info("Crime successful!")
                 return True
             else:
-                print(f"Crime failed: {result_text}")
+                logger.warning("Crime failed: %s", result_text)
                 return False
         except Exception as e:
-            print(f"Error committing crime: {str(e)}")
+            logger.error("Error committing crime: %s", e)
             return False
     
     def train_gym(self, stat: str) -> bool:
@@ -200,46 +325,29 @@ class TornBrowser:
             return False
         
         try:
-            print(f"Training {stat} at the gym...")
+            logger.info("Training %s at the gym...", stat)
             
-            # Navigate to gym page
-            self.driver.get(f"{self.base_url}/gym.php")
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".content-title"))
-            )
+            # Navigate to gym page and wait for it to load
+            self._open("/gym.php")
             
             # Find and click on the stat
-            stat_element = self.driver.find_element(By.CSS_SELECTOR, f"#train-{stat}")
+            stat_element = self.driver.find_element(*_id_locator("train-", stat))
             stat_element.click()
             
-            # Wait for training form to appear
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".train-submit"))
-            )
-            
-            # Click the submit button
-            submit_button = self.driver.find_element(By.CSS_SELECTOR, ".train-submit")
-            submit_button.click()
-            
-            # Wait for result
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".msg"))
-            )
+            # Wait for training form to appear and click the submit button
+            self._wait(self._LOC_TRAIN_SUBMIT).click()
             
-            # Check result
-            result_element = self.driver.find_element(By.CSS_SELECTOR, ".msg")
-            result_text = result_element.text
+            # Wait for result and check it
+            result_text = self._read_result()
             
-            if "trained" in result_text.lower():
-                print("Training successful!")
+            if _GYM_SUCCESS_RE.search(result_text):
+                logger.info("Training successful!")
                 return True
             else:
-                print(f"Training failed: {result_text}")
+                logger.warning("Training failed: %s", result_text)
                 return False
         except Exception as e:
-            print(f"Error training at gym: {str(e)}")
+            logger.error("Error training at gym: %s", e)
             return False
     
     def use_item(self, item_id: str) -> bool:
@@ -256,41 +364,30 @@ class TornBrowser:
             return False
         
         try:
-            print(f"Using item {item_id}...")
+            logger.info("Using item %s...", item_id)
             
-            # Navigate to items page
-            self.driver.get(f"{self.base_url}/item.php")
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".content-title"))
-            )
+            # Navigate to items page and wait for it to load
+            self._open("/item.php")
             
             # Find and click on the item
-            item_element = self.driver.find_element(By.CSS_SELECTOR, f"#item{item_id}")
+            item_element = self.driver.find_element(*_id_locator("item", item_id))
             item_element.click()
             
             # Find and click the use button
-            use_button = self.driver.find_element(By.CSS_SELECTOR, ".use-item")
+            use_button = self.driver.find_element(*self._LOC_USE_ITEM)
             use_button.click()
             
-            # Wait for result
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".msg"))
-            )
-            
-            # Check result
-            result_element = self.driver.find_element(By.CSS_SELECTOR, ".msg")
-            result_text = result_element.text
+            # Wait for result and check it
+            result_text = self._read_result()
             
-            if "used" in result_text.lower():
-                print("Item used successfully!")
+            if _ITEM_SUCCESS_RE.search(result_text):
+                logger.info("Item used successfully!")
                 return True
             else:
-                print(f"Failed to use item: {result_text}")
+                logger.warning("Failed to use item: %s", result_text)
                 return False
         except Exception as e:
-            print(f"Error using item: {str(e)}")
+            logger.error("Error using item: %s", e)
             return False
     
     def start_education(self, course_id: str) -> bool:
@@ -307,71 +404,54 @@ class TornBrowser:
             return False
         
         try:
-            print(f"Starting education course {course_id}...")
+            logger.info("Starting education course %s...", course_id)
             
-            # Navigate to education page
-            self.driver.get(f"{self.base_url}/education.php")
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".content-title"))
-            )
+            # Navigate to education page and wait for it to load
+            self._open("/education.php")
             
             # Check if already studying
-            current_course = self.driver.find_elements(By.CSS_SELECTOR, ".education-active")
+            current_course = self.driver.find_elements(*self._LOC_EDUCATION_ACTIVE)
             if current_course:
-                print("Already studying a course.")
+                logger.info("Already studying a course.")
                 return False
             
             # Find and click on the course
-            course_element = self.driver.find_element(By.CSS_SELECTOR, f"#course{course_id}")
+            course_element = self.driver.find_element(*_id_locator("course", course_id))
             course_element.click()
             
-            # Wait for course details to appear
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".start-education"))
-            )
-            
-            # Click the start button
-            start_button = self.driver.find_element(By.CSS_SELECTOR, ".start-education")
-            start_button.click()
-            
-            # Wait for result
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".msg"))
-            )
+            # Wait for course details to appear and click the start button
+            self._wait(self._LOC_START_EDUCATION).click()
             
-            # Check result
-            result_element = self.driver.find_element(By.CSS_SELECTOR, ".msg")
-            result_text = result_element.text
+            # Wait for result and check it
+            result_text = self._read_result()
             
-            if "started" in result_text.lower():
-                print("Course started successfully!")
+            if _EDUCATION_SUCCESS_RE.search(result_text):
+                logger.info("Course started successfully!")
                 return True
             else:
-                print(f"Failed to start course: {result_text}")
+                logger.warning("Failed to start course: %s", result_text)
                 return False
         except Exception as e:
-            print(f"Error starting education course: {str(e)}")
+            logger.error("Error starting education course: %s", e)
             return False
     
     def close(self):
         """Close the browser"""
         if self.driver:
             try:
-                print("Closing browser...")
+                logger.info("Closing browser...")
                 self.driver.quit()
-                print("Browser closed.")
+                logger.info("Browser closed.")
             except Exception as e:
-                print(f"Error closing browser: {str(e)}")
+                logger.error("Error closing browser: %s", e)
 
 
 if __name__ == "__main__":
-    # Example usage
-    headless = os.getenv("HEADLESS_BROWSER", "false").lower() in ("true", "1", "t", "yes", "y")
+    logging.basicConfig(level=CONFIG.log_level, format="%(message)s")
     
+    # Example usage
     try:
-        browser = TornBrowser(headless=headless)
+        browser = TornBrowser(headless=CONFIG.headless_browser)
         print("Browser initialized.")
         
         if browser.login():
@@ -0,0 +1,53 @@
+import os
+from dataclasses import dataclass
+from typing import Mapping
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Values accepted as true for boolean environment variables
+_BOOL_TRUE = frozenset({"true", "1", "t", "yes", "y", "on"})
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Bot settings read from the environment
+    """
+    api_call_interval: int = 60
+    enable_crimes: bool = True
+    enable_gym: bool = True
+    enable_items: bool = True
+    enable_education: bool = True
+    enable_travel: bool = False
+    headless_browser: bool = True
+    log_level: str = "WARNING"
+    
+    @classmethod
+    def load(cls, environ: Mapping[str, str] = os.environ) -> "Config":
+        """
+        Build the settings from a single snapshot of the environment
+        
+        Args:
+            environ: Environment variables to read (defaults to os.environ)
+            
+        Returns:
+            The loaded settings
+        """
+        env = dict(environ)
+        
+        def flag(key: str, default: bool) -> bool:
+            return env.get(key, "1" if default else "0").strip().lower() in _BOOL_TRUE
+        
+        return cls(
+            api_call_interval=int(env.get("API_CALL_INTERVAL", "60")),
+            enable_crimes=flag("ENABLE_CRIMES", True),
+            enable_gym=flag("ENABLE_GYM", True),
+            enable_items=flag("ENABLE_ITEMS", True),
+            enable_education=flag("ENABLE_EDUCATION", True),
+            enable_travel=flag("ENABLE_TRAVEL", False),
+            headless_browser=flag("HEADLESS_BROWSER", True),
+            log_level=env.get("LOG_LEVEL", "WARNING").upper(),
+        )
+
+CONFIG = Config.load()
\ No newline at end of file
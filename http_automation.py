@@ -0,0 +1,288 @@
+import os
+import logging
+import re
+import json
+import time
+from typing import Dict, Any, Optional
+from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Shared session so every client reuses the same cookies and pooled connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=20))
+_session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# A CAPTCHA widget or challenge element; the bare word also shows up in script tags on normal pages
+_CAPTCHA_RE = re.compile(r"""<[^>]+(?:\b(?:id|class)\s*=\s*["'][^"']*\b(?:g-recaptcha|h-captcha|captcha)\b|\bdata-sitekey\s*=)""", re.I)
+_USER_INFO_RE = re.compile(r"class=\"[^\"]*\buser-info\b")
+_MSG_RE = re.compile(r"class=\"[^\"]*\bmsg\b[^\"]*\"[^>]*>(.*?)</div>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Result messages that mean an action succeeded (shared with browser_automation)
+_CRIME_SUCCESS_RE = re.compile(r"success", re.I)
+_GYM_SUCCESS_RE = re.compile(r"trained", re.I)
+_ITEM_SUCCESS_RE = re.compile(r"used", re.I)
+_EDUCATION_SUCCESS_RE = re.compile(r"started", re.I)
+
+class TornHttpClient:
+    """
+    A class to perform Torn actions with plain HTTP requests instead of a browser
+    """
+    
+    # Seconds to leave actions to the browser after Torn asks for a CAPTCHA
+    CAPTCHA_COOLDOWN = 900
+    
+    def __init__(self, timeout: float = 15):
+        """
+        Initialize the TornHttpClient class
+        
+        Args:
+            timeout: Timeout in seconds for each request
+        """
+        self.base_url = "https://www.torn.com"
+        self.username = os.getenv("TORN_USERNAME")
+        self.password = os.getenv("TORN_PASSWORD")
+        
+        if not self.username or not self.password:
+            raise ValueError("Username and password are required for HTTP automation. Set them in .env file.")
+        
+        self.session = _session
+        self.timeout = timeout
+        self.logged_in = False
+        # When Torn last answered with a CAPTCHA (monotonic time)
+        self._captcha_seen: Optional[float] = None
+    
+    @property
+    def captcha_required(self) -> bool:
+        """Whether Torn asked for a CAPTCHA recently; callers should fall back to the browser"""
+        if self._captcha_seen is None:
+            return False
+        if time.monotonic() - self._captcha_seen >= self.CAPTCHA_COOLDOWN:
+            self._captcha_seen = None
+            return False
+        return True
+    
+    def login(self) -> bool:
+        """
+        Log in to Torn
+        
+        Returns:
+            True if login successful, False otherwise
+        """
+        if self.logged_in:
+            return True
+        
+        try:
+            logger.info("Logging in to Torn over HTTP...")
+            
+            response = self.session.post(
+                f"{self.base_url}/login.php",
+                data={"player": self.username, "password": self.password},
+                timeout=self.timeout,
+            )
+            
+            if _CAPTCHA_RE.search(response.text):
+                logger.warning("Login requires a CAPTCHA.")
+                self._captcha_seen = time.monotonic()
+                return False
+            
+            if response.status_code != 200 or not _USER_INFO_RE.search(response.text):
+                logger.warning("Login failed: HTTP %s", response.status_code)
+                return False
+            
+            self.logged_in = True
+            logger.info("Login successful.")
+            return True
+        except Exception as e:
+            logger.warning("Login failed: %s", e)
+            return False
+    
+    def _post(self, path: str, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Submit a form and extract the result message
+        
+        Args:
+            path: Page path relative to the base URL
+            data: Form fields to submit
+            
+        Returns:
+            The result message, or None if the request could not be completed
+        """
+        if not self.logged_in and not self.login():
+            return None
+        
+        response = self.session.post(f"{self.base_url}{path}", data=data, timeout=self.timeout)
+        response.raise_for_status()
+        
+        if _CAPTCHA_RE.search(response.text):
+            logger.warning("Action requires a CAPTCHA.")
+            self._captcha_seen = time.monotonic()
+            return None
+        
+        # Torn redirects to the login page once the session expires
+        if "/login" in response.url:
+            logger.warning("Session expired.")
+            self.logged_in = False
+            return None
+        
+        return self._parse_message(response.text)
+    
+    def _parse_message(self, body: str) -> str:
+        """
+        Extract the result message from a response body
+        
+        Args:
+            body: JSON or HTML response body
+            
+        Returns:
+            The result message (empty if none was found)
+        """
+        try:
+            data = json.loads(body)
+        except ValueError:
+            match = _MSG_RE.search(body)
+            return _TAG_RE.sub("", match.group(1)).strip() if match else ""
+        
+        if isinstance(data, dict):
+            return str(data.get("msg") or data.get("message") or "")
+        return ""
+    
+    def commit_crime(self, crime_id: str) -> bool:
+        """
+        Commit a crime
+        
+        Args:
+            crime_id: ID of the crime to commit
+            
+        Returns:
+            True if crime was committed, False otherwise
+        """
+        try:
+            logger.info("Committing crime %s...", crime_id)
+            
+            result_text = self._post("/crimes.php", {"step": "commitCrime", "crime_id": crime_id})
+            if result_text is None:
+                return False
+            
+            if _CRIME_SUCCESS_RE.search(result_text):
+                logger.info("Crime successful!")
+                return True
+            else:
+                logger.warning("Crime failed: %s", result_text)
+                return False
+        except Exception as e:
+            logger.error("Error committing crime: %s", e)
+            return False
+    
+    def train_gym(self, stat: str) -> bool:
+        """
+        Train at the gym
+        
+        Args:
+            stat: Stat to train (strength, defense, speed, dexterity)
+            
+        Returns:
+            True if training was successful, False otherwise
+        """
+        try:
+            logger.info("Training %s at the gym...", stat)
+            
+            result_text = self._post("/gym.php", {"step": "train", "stat": stat})
+            if result_text is None:
+                return False
+            
+            if _GYM_SUCCESS_RE.search(result_text):
+                logger.info("Training successful!")
+                return True
+            else:
+                logger.warning("Training failed: %s", result_text)
+                return False
+        except Exception as e:
+            logger.error("Error training at gym: %s", e)
+            return False
+    
+    def use_item(self, item_id: str) -> bool:
+        """
+        Use an item from inventory
+        
+        Args:
+            item_id: ID of the item to use
+            
+        Returns:
+            True if item was used, False otherwise
+        """
+        try:
+            logger.info("Using item %s...", item_id)
+            
+            result_text = self._post("/item.php", {"step": "useItem", "itemID": item_id})
+            if result_text is None:
+                return False
+            
+            if _ITEM_SUCCESS_RE.search(result_text):
+                logger.info("Item used successfully!")
+                return True
+            else:
+                logger.warning("Failed to use item: %s", result_text)
+                return False
+        except Exception as e:
+            logger.error("Error using item: %s", e)
+            return False
+    
+    def start_education(self, course_id: str) -> bool:
+        """
+        Start an education course
+        
+        Args:
+            course_id: ID of the course to start
+            
+        Returns:
+            True if course was started, False otherwise
+        """
+        try:
+            logger.info("Starting education course %s...", course_id)
+            
+            result_text = self._post("/education.php", {"step": "startCourse", "course_id": course_id})
+            if result_text is None:
+                return False
+            
+            if _EDUCATION_SUCCESS_RE.search(result_text):
+                logger.info("Course started successfully!")
+                return True
+            else:
+                logger.warning("Failed to start course: %s", result_text)
+                return False
+        except Exception as e:
+            logger.error("Error starting education course: %s", e)
+            return False
+    
+    def close(self):
+        """Forget the current login"""
+        self.session.cookies.clear()
+        self.logged_in = False
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), format="%(message)s")
+    
+    # Example usage
+    try:
+        client = TornHttpClient()
+        
+        if client.login():
+            print("Logged in successfully.")
+            
+            # Example: Commit a crime
+            # client.commit_crime("1")
+            
+            # Example: Train at the gym
+            # client.train_gym("strength")
+        elif client.captcha_required:
+            print("Torn requires a CAPTCHA. Use browser_automation.py instead.")
+    except Exception as e:
+        print(f"Error: {str(e)}")
\ No newline at end of file
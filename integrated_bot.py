@@ -1,171 +1,325 @@
-import os
+import logging
 import time
-import random
-import schedule
 import json
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 
-from torn_api import TornAPI
+from config import CONFIG
+from torn_api import TornAPI, UserStatus
 from browser_automation import TornBrowser
+from http_automation import TornHttpClient
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class IntegratedTornBot:
     """
     An integrated bot that uses both API and browser automation to automate Torn activities
     """
     
+    # Seconds that slowly-changing selections stay fresh before they are fetched again
+    SELECTION_TTLS = {"crimes": 30, "inventory": 60, "gyms": 300}
+    
     def __init__(self):
         """Initialize the IntegratedTornBot"""
         # Initialize API client
         self.api = TornAPI()
         
-        # Initialize browser (if needed)
-        self.headless = self._parse_bool_env("HEADLESS_BROWSER", False)
+        # Initialize HTTP client and browser (if needed)
+        self.http = None
         self.browser = None
         
         # User info
         self.user_id = None
         self.name = None
         
-        # Feature flags
-        self.enable_crimes = self._parse_bool_env("ENABLE_CRIMES", True)
-        self.enable_gym = self._parse_bool_env("ENABLE_GYM", True)
-        self.enable_items = self._parse_bool_env("ENABLE_ITEMS", True)
-        self.enable_education = self._parse_bool_env("ENABLE_EDUCATION", True)
-        self.enable_travel = self._parse_bool_env("ENABLE_TRAVEL", False)
-        
-        # Cache for data
+        # Cache for data; selection entries are keyed by frozenset of selections
         self.cache = {}
         
+        # Item ids of energy drinks, from the torn item catalog (None if unavailable)
+        self._energy_drink_ids = None
+        
+        # Crimes sorted by descending success rate, rebuilt whenever new crime data arrives
+        # (success rates change between fetches); reused while the cached copy is served
+        self._crimes_sorted = []
+        self._crimes_src = None
+        
+        # Gym stats are trained in turn
+        self._stat_iter = itertools.cycle(("strength", "defense", "speed", "dexterity"))
+        
+        # Course to start next, kept until it is started or completed
+        self._next_course_id = None
+        
         # Initialize user data
         self._initialize()
     
-    def _parse_bool_env(self, key: str, default: bool = False) -> bool:
-        """Parse boolean environment variables"""
-        value = os.getenv(key, str(default)).lower()
-        return value in ("true", "1", "t", "yes", "y")
-    
     def _initialize(self):
         """Initialize the bot with user data"""
-        print("Initializing IntegratedTornBot...")
+        logger.info("Initializing IntegratedTornBot...")
         
         # Get user profile
         user_data = self.api.get_user(["profile"])
         if "error" in user_data:
-            print("Failed to initialize bot. Check your API key.")
+            logger.warning("Failed to initialize bot. Check your API key.")
             return
         
         self.user_id = user_data.get("player_id")
         self.name = user_data.get("name")
         
-        print(f"Bot initialized for: {self.name} [{self.user_id}]")
-        print(f"Features enabled:")
-        print(f"  - Crimes: {self.enable_crimes}")
-        print(f"  - Gym: {self.enable_gym}")
-        print(f"  - Items: {self.enable_items}")
-        print(f"  - Education: {self.enable_education}")
-        print(f"  - Travel: {self.enable_travel}")
-        print(f"Browser mode: {'Headless' if self.headless else 'Visible'}")
+        logger.info("Bot initialized for: %s [%s]", self.name, self.user_id)
+        logger.info("Features enabled:")
+        logger.info("  - Crimes: %s", CONFIG.enable_crimes)
+        logger.info("  - Gym: %s", CONFIG.enable_gym)
+        logger.info("  - Items: %s", CONFIG.enable_items)
+        logger.info("  - Education: %s", CONFIG.enable_education)
+        logger.info("  - Travel: %s", CONFIG.enable_travel)
+        logger.info("Browser mode: %s", 'Headless' if CONFIG.headless_browser else 'Visible')
+        
+        if CONFIG.enable_items:
+            self._load_energy_drink_ids()
+    
+    def _load_energy_drink_ids(self):
+        """Look up the item ids of energy drinks once from the torn item catalog"""
+        # Stream the catalog so only the matching ids are kept in memory
+        energy_drink_ids = frozenset(
+            item_id for item_id, item in self.api.iter_items("torn", ["items"], "items")
+            if "energy drink" in item.get("name", "").lower()
+        )
+        if not energy_drink_ids:
+            logger.warning("Failed to load item catalog. Falling back to matching item names.")
+            return
+        
+        self._energy_drink_ids = energy_drink_ids
     
     def _initialize_browser(self):
-        """Initialize the browser if needed"""
-        if self.browser is None:
+        """Initialize the browser if needed, restarting it if its session was lost"""
+        if self.browser is not None:
+            if self.browser.is_alive():
+                return True
+            
             try:
-                print("Initializing browser...")
-                self.browser = TornBrowser(headless=self.headless)
+                logger.warning("Browser session lost. Restarting browser...")
+                self.browser.restart()
                 return True
             except Exception as e:
-                print(f"Failed to initialize browser: {str(e)}")
+                logger.warning("Failed to restart browser: %s", e)
+                self.browser = None
+                return False
+        
+        try:
+            logger.info("Initializing browser...")
+            self.browser = TornBrowser(headless=CONFIG.headless_browser)
+            return True
+        except Exception as e:
+            logger.warning("Failed to initialize browser: %s", e)
+            return False
+    
+    def _initialize_http(self):
+        """Initialize the HTTP client if needed"""
+        if self.http is None:
+            try:
+                self.http = TornHttpClient()
+            except Exception as e:
+                logger.warning("Failed to initialize HTTP client: %s", e)
                 return False
         return True
     
+    def _perform(self, action: str, *args) -> bool:
+        """
+        Perform an automation action over HTTP, falling back to the browser
+        when Torn asks for a CAPTCHA
+        
+        Args:
+            action: Name of the action method (commit_crime, train_gym, use_item, start_education)
+            *args: Arguments for the action
+            
+        Returns:
+            True if the action succeeded, False otherwise
+        """
+        if self._initialize_http() and not self.http.captcha_required:
+            result = getattr(self.http, action)(*args)
+            if not self.http.captcha_required:
+                return result
+            logger.warning("CAPTCHA detected, falling back to browser automation.")
+        
+        # The browser is health-checked once per tick in _run_actions
+        if (self.browser is not None or self._initialize_browser()) and self.browser.login():
+            return getattr(self.browser, action)(*args)
+        
+        logger.warning("Failed to initialize browser or login.")
+        return False
+    
+    def _get_selection(self, selection: str) -> Dict[str, Any]:
+        """
+        Get a user selection from the cached status, fetching it only on a cache miss
+        
+        Args:
+            selection: API selection fetched on every tick (e.g. education)
+            
+        Returns:
+            User data containing the selection
+        """
+        user_data = self.cache.get("user_data", {})
+        if selection in user_data:
+            return user_data
+        return self.api.get_user([selection])
+    
+    def _cached_entry(self, selections: Tuple[str, ...], ttl: float) -> Optional[Dict[str, Any]]:
+        """
+        Get cached data for selections if it is younger than ttl
+        
+        Args:
+            selections: API selections
+            ttl: Maximum age in seconds
+            
+        Returns:
+            The cached data, or None if missing or expired
+        """
+        entry = self.cache.get(frozenset(selections))
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+    
+    def _cached_get(self, selections: Tuple[str, ...], ttl: float) -> Dict[str, Any]:
+        """
+        Get user data for selections, reusing cached data younger than ttl
+        
+        Args:
+            selections: API selections
+            ttl: Maximum age in seconds of cached data
+            
+        Returns:
+            User data containing the selections
+        """
+        data = self._cached_entry(selections, ttl)
+        if data is not None:
+            return data
+        
+        data = self.api.get_user(list(selections))
+        if "error" not in data:
+            self.cache[frozenset(selections)] = (time.monotonic(), data)
+        return data
+    
     def update_status(self):
-        """Update and print the current user status"""
-        # Get user data with multiple selections
+        """Update and print the current user status, then run actions"""
+        if self._fetch_status():
+            self._run_actions()
+    
+    def _fetch_status(self) -> bool:
+        """
+        Fetch, cache and print the current user status
+        
+        Returns:
+            True if the status was updated, False otherwise
+        """
+        # Get everything this tick needs in a single request
         selections = ["profile", "bars", "cooldowns", "notifications"]
-        if self.enable_education:
+        if CONFIG.enable_education:
             selections.append("education")
         
+        # Slowly-changing selections ride along once their cached copy would expire before the
+        # next tick, so the actions always find them fresh and never fetch them on their own
+        for selection, enabled in (("crimes", CONFIG.enable_crimes), ("gyms", CONFIG.enable_gym), ("inventory", CONFIG.enable_items)):
+            ttl = self.SELECTION_TTLS[selection] - CONFIG.api_call_interval
+            if enabled and self._cached_entry((selection,), ttl) is None:
+                selections.append(selection)
+        
         user_data = self.api.get_user(selections)
         if "error" in user_data:
-            print("Failed to update status.")
-            return
+            logger.warning("Failed to update status.")
+            return False
         
-        # Cache the data
+        # Cache the data, with the status fields copied out once
         self.cache["user_data"] = user_data
+        self.cache["status"] = status = UserStatus.from_json(user_data)
+        now = time.monotonic()
+        for selection in self.SELECTION_TTLS:
+            if selection in user_data:
+                self.cache[frozenset((selection,))] = (now, {selection: user_data[selection]})
         
         # Print status
-        print("\n" + "="*50)
-        print(f"Status update for {self.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*50)
-        
-        # Print bars
-        if "bars" in user_data:
-            bars = user_data["bars"]
-            print(f"Energy: {bars['energy']['current']}/{bars['energy']['maximum']}")
-            print(f"Nerve: {bars['nerve']['current']}/{bars['nerve']['maximum']}")
-            print(f"Happy: {bars['happy']['current']}/{bars['happy']['maximum']}")
-            print(f"Life: {bars['life']['current']}/{bars['life']['maximum']}")
-        
-        # Print cooldowns
-        if "cooldowns" in user_data:
-            cooldowns = user_data["cooldowns"]
-            for name, seconds in cooldowns.items():
-                if seconds > 0:
-                    minutes = seconds // 60
-                    remaining_seconds = seconds % 60
-                    print(f"{name.capitalize()} cooldown: {minutes}m {remaining_seconds}s")
-        
-        # Print notifications
-        if "notifications" in user_data and user_data["notifications"]:
-            print("\nNotifications:")
-            for category, count in user_data["notifications"].items():
-                if count > 0:
-                    print(f"  - {category}: {count}")
+        if logger.isEnabledFor(logging.INFO):
+            self._log_status(status)
         
-        # Print education status
-        if "education" in user_data and "education_current" in user_data:
-            current = user_data["education_current"]
-            if current:
-                time_left = current.get("time_left", 0)
-                minutes = time_left // 60
-                remaining_seconds = time_left % 60
-                print(f"\nCurrently studying: {current.get('name', 'Unknown')} - {minutes}m {remaining_seconds}s remaining")
+        return True
+    
+    def _log_status(self, status: UserStatus):
+        """
+        Log the status report as a single message
+        
+        Args:
+            status: User status from the latest status update
+        """
+        separator = "=" * 50
+        lines = [
+            separator,
+            f"Status update for {self.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            separator,
+        ]
+        
+        # Bars
+        lines.append(f"Energy: {status.energy_current}/{status.energy_maximum}")
+        lines.append(f"Nerve: {status.nerve_current}/{status.nerve_maximum}")
+        lines.append(f"Happy: {status.happy_current}/{status.happy_maximum}")
+        lines.append(f"Life: {status.life_current}/{status.life_maximum}")
+        
+        # Cooldowns
+        lines.extend(
+            f"{name.capitalize()} cooldown: {minutes}m {remaining_seconds}s"
+            for name, seconds in status.cooldowns.items() if seconds > 0
+            for minutes, remaining_seconds in (divmod(seconds, 60),)
+        )
+        
+        # Notifications
+        if status.notifications:
+            lines.append("\nNotifications:")
+            for category, count in status.notifications.items():
+                if count > 0:
+                    lines.append(f"  - {category}: {count}")
         
-        print("="*50)
+        # Education
+        current = status.education_current
+        if current:
+            minutes, remaining_seconds = divmod(current.get("time_left", 0), 60)
+            lines.append(f"\nCurrently studying: {current.get('name', 'Unknown')} - {minutes}m {remaining_seconds}s remaining")
         
-        # Run actions based on status
-        self._run_actions()
+        lines.append(separator)
+        logger.info("\n".join(lines))
     
     def _run_actions(self):
         """Run actions based on current status"""
-        if not self.cache.get("user_data"):
-            print("No user data available. Skipping actions.")
+        status = self.cache.get("status")
+        if status is None:
+            logger.warning("No user data available. Skipping actions.")
             return
         
-        user_data = self.cache["user_data"]
-        
         # Check if we can perform actions
-        if "status" in user_data and user_data["status"].get("state") != "okay":
-            state = user_data["status"].get("state", "unknown")
-            print(f"Cannot perform actions. Current state: {state}")
+        if status.state != "okay":
+            logger.warning("Cannot perform actions. Current state: %s", status.state)
             return
         
+        # Check the shared browser once so every action below can reuse it; if it cannot be
+        # restarted it is dropped, and _perform only needs it again as a CAPTCHA fallback
+        if self.browser is not None:
+            self._initialize_browser()
+        
         # Run enabled actions
-        if self.enable_crimes:
+        if CONFIG.enable_crimes:
             self.do_crimes()
         
-        if self.enable_gym:
+        if CONFIG.enable_gym:
             self.do_gym()
         
-        if self.enable_items:
+        if CONFIG.enable_items:
             self.use_items()
         
-        if self.enable_education:
+        if CONFIG.enable_education:
             self.do_education()
     
     def do_crimes(self):
@@ -173,103 +327,93 @@ class IntegratedTornBot:
         if not self.cache.get("user_data"):
             return
         
-        user_data = self.cache["user_data"]
+        current_nerve = self.cache["status"].nerve_current
         
         # Check if we have nerve
-        if "bars" in user_data and user_data["bars"]["nerve"]["current"] > 0:
-            print("\nPerforming crimes...")
+        if current_nerve > 0:
+            logger.info("Performing crimes...")
             
             # Get crime data
-            crime_data = self.api.get_user(["crimes"])
+            crime_data = self._cached_get(("crimes",), ttl=self.SELECTION_TTLS["crimes"])
             if "error" in crime_data:
-                print("Failed to get crime data.")
+                logger.warning("Failed to get crime data.")
                 return
             
-            # Find the best crime to commit
-            best_crime = None
-            best_success = 0
+            crimes = crime_data.get("crimes", {})
+            if crimes is not self._crimes_src:
+                self._crimes_src = crimes
+                self._crimes_sorted = sorted(crimes.items(), key=lambda kv: -kv[1].get("success", 0))
             
-            for crime_id, crime in crime_data.get("crimes", {}).items():
-                success = crime.get("success", 0)
-                nerve = crime.get("nerve", 100)  # Default to high value if not found
-                
-                # Only consider crimes we have enough nerve for
-                if user_data["bars"]["nerve"]["current"] >= nerve:
-                    if success > best_success:
-                        best_success = success
-                        best_crime = crime_id
+            # Find the best crime to commit: the first one we have enough nerve for
+            # (crimes without a nerve cost default to a high value)
+            best_crime = next(
+                (crime_id for crime_id, crime in self._crimes_sorted
+                 if crime.get("success", 0) > 0 and crime.get("nerve", 100) <= current_nerve),
+                None
+            )
             
             if best_crime:
-                # Commit the crime using browser automation
-                print(f"Committing crime: {crime_data['crimes'][best_crime]['name']} (Success rate: {best_success}%)")
-                
-                if self._initialize_browser() and self.browser.login():
-                    self.browser.commit_crime(best_crime)
-                else:
-                    print("Failed to initialize browser or login.")
+                # Commit the crime
+                crime = crimes.get(best_crime, {})
+                logger.info("Committing crime: %s (Success rate: %s%%)", crime.get('name', 'Unknown'), crime.get('success', 0))
+                self._perform("commit_crime", best_crime)
             else:
-                print("No suitable crimes found.")
+                logger.info("No suitable crimes found.")
         else:
-            print("Not enough nerve to commit crimes.")
+            logger.info("Not enough nerve to commit crimes.")
     
     def do_gym(self):
         """Train at the gym if energy is available"""
         if not self.cache.get("user_data"):
             return
         
-        user_data = self.cache["user_data"]
-        
         # Check if we have energy
-        if "bars" in user_data and user_data["bars"]["energy"]["current"] > 0:
-            print("\nTraining at the gym...")
+        if self.cache["status"].energy_current > 0:
+            logger.info("Training at the gym...")
             
             # Get gym data
-            gym_data = self.api.get_user(["gyms"])
+            gym_data = self._cached_get(("gyms",), ttl=self.SELECTION_TTLS["gyms"])
             if "error" in gym_data:
-                print("Failed to get gym data.")
+                logger.warning("Failed to get gym data.")
                 return
             
             # Choose a stat to train (rotate between stats)
-            stats = ["strength", "defense", "speed", "dexterity"]
-            stat_to_train = stats[random.randint(0, 3)]  # Random stat for now
+            stat_to_train = next(self._stat_iter)
             
-            print(f"Training {stat_to_train}...")
+            logger.info("Training %s...", stat_to_train)
             
-            # Train using browser automation
-            if self._initialize_browser() and self.browser.login():
-                self.browser.train_gym(stat_to_train)
-            else:
-                print("Failed to initialize browser or login.")
+            self._perform("train_gym", stat_to_train)
         else:
-            print("Not enough energy to train at the gym.")
+            logger.info("Not enough energy to train at the gym.")
     
     def use_items(self):
         """Use items from inventory"""
-        print("\nChecking inventory for usable items...")
+        logger.info("Checking inventory for usable items...")
         
         # Get inventory data
-        inventory_data = self.api.get_user(["inventory"])
+        inventory_data = self._cached_get(("inventory",), ttl=self.SELECTION_TTLS["inventory"])
         if "error" in inventory_data:
-            print("Failed to get inventory data.")
+            logger.warning("Failed to get inventory data.")
             return
         
         # Check for energy drinks or other useful items
-        energy_drinks = []
-        for item_id, item in inventory_data.get("inventory", {}).items():
-            # Check if it's an energy drink (this is simplified, you'd need to identify items by their properties)
-            if "energy drink" in item.get("name", "").lower():
-                energy_drinks.append(item_id)
+        inventory = inventory_data.get("inventory", {})
+        if self._energy_drink_ids is not None:
+            energy_drinks = list(inventory.keys() & self._energy_drink_ids)
+        else:
+            energy_drinks = [
+                item_id for item_id, item in inventory.items()
+                if "energy drink" in item.get("name", "").lower()
+            ]
         
         if energy_drinks:
-            print(f"Found {len(energy_drinks)} energy drinks in inventory.")
+            logger.info("Found %s energy drinks in inventory.", len(energy_drinks))
             
-            # Use the first energy drink
-            if self._initialize_browser() and self.browser.login():
-                self.browser.use_item(energy_drinks[0])
-            else:
-                print("Failed to initialize browser or login.")
+            # Use the first energy drink; the cached inventory is stale once it succeeds
+            if self._perform("use_item", energy_drinks[0]):
+                self.cache.pop(frozenset(("inventory",)), None)
         else:
-            print("No usable items found in inventory.")
+            logger.info("No usable items found in inventory.")
     
     def do_education(self):
         """Start education courses if not currently studying"""
@@ -279,73 +423,94 @@ class IntegratedTornBot:
         user_data = self.cache["user_data"]
         
         # Check if we're already studying
-        if "education_current" in user_data and user_data["education_current"]:
-            print("Already studying a course.")
+        if self.cache["status"].education_current:
+            logger.info("Already studying a course.")
             return
         
-        print("\nChecking for education courses...")
+        logger.info("Checking for education courses...")
         
         # Get education data
         if "education" not in user_data:
-            education_data = self.api.get_user(["education"])
+            education_data = self._get_selection("education")
             if "error" in education_data:
-                print("Failed to get education data.")
+                logger.warning("Failed to get education data.")
                 return
             user_data["education"] = education_data.get("education", {})
         
-        # Find a suitable course
-        suitable_courses = []
-        for course_id, course in user_data["education"].items():
-            # Skip completed courses
-            if course.get("completed", 0) > 0:
-                continue
+        # Find a suitable course, reusing the one picked earlier while it is not completed
+        education = user_data["education"]
+        course_id = self._next_course_id
+        if course_id is None or education.get(course_id, {}).get("completed", 0) > 0:
+            # Choose the first course that is not completed (could implement more complex selection logic)
+            course_id = next(
+                (cid for cid, course in education.items() if course.get("completed", 0) <= 0),
+                None
+            )
+            self._next_course_id = course_id
+        
+        if course_id is not None:
+            course = education.get(course_id, {})
             
-            # Add to suitable courses
-            suitable_courses.append(course_id)
-        
-        if suitable_courses:
-            # Choose the first course for now (could implement more complex selection logic)
-            course_id = suitable_courses[0]
-            course = user_data["education"][course_id]
-            
-            print(f"Starting course: {course.get('name', 'Unknown')}")
+            logger.info("Starting course: %s", course.get('name', 'Unknown'))
             
-            # Start the course using browser automation
-            if self._initialize_browser() and self.browser.login():
-                self.browser.start_education(course_id)
-            else:
-                print("Failed to initialize browser or login.")
+            # Start the course; pick again once it has started
+            if self._perform("start_education", course_id):
+                self._next_course_id = None
         else:
-            print("No suitable education courses found.")
+            logger.info("No suitable education courses found.")
     
-    def run(self):
-        """Run the bot"""
-        print("Starting IntegratedTornBot...")
-        
-        # Update status immediately
-        self.update_status()
-        
-        # Schedule status updates
-        interval = int(os.getenv("API_CALL_INTERVAL", "60"))
-        print(f"Scheduling status updates every {interval} seconds")
+    def _close_automation(self):
+        """Close the API session, HTTP client and browser"""
+        self.api.close()
+        if self.http:
+            self.http.close()
+        if self.browser:
+            self.browser.close()
+    
+    async def _run_loop(self):
+        """Update status on a fixed interval, running actions in the background"""
+        interval = CONFIG.api_call_interval
+        logger.info("Scheduling status updates every %s seconds", interval)
         
-        schedule.every(interval).seconds.do(self.update_status)
+        loop = asyncio.get_running_loop()
+        # Actions drive a single browser/session, so they run one at a time on their own thread
+        action_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="torn-actions")
+        actions = None
+        next_tick = loop.time()
         
-        # Run the scheduler
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(1)
+                # The API call overlaps with actions still running from the previous tick
+                if await loop.run_in_executor(None, self._fetch_status):
+                    if actions is not None and actions.done() and actions.exception():
+                        logger.error("Actions failed: %s", actions.exception())
+                    
+                    if actions is None or actions.done():
+                        actions = loop.run_in_executor(action_executor, self._run_actions)
+                    else:
+                        logger.warning("Previous actions still running. Skipping actions this tick.")
+                
+                # Sleep straight through to the next deadline
+                next_tick = max(next_tick + interval, loop.time())
+                await asyncio.sleep(next_tick - loop.time())
+        finally:
+            action_executor.shutdown(wait=True)
+    
+    def run(self):
+        """Run the bot"""
+        logger.info("Starting IntegratedTornBot...")
+        
+        try:
+            asyncio.run(self._run_loop())
         except KeyboardInterrupt:
-            print("\nBot stopped by user.")
-            if self.browser:
-                self.browser.close()
+            logger.info("Bot stopped by user.")
+            self._close_automation()
         except Exception as e:
-            print(f"\nBot stopped due to error: {str(e)}")
-            if self.browser:
-                self.browser.close()
-
+            logger.error("Bot stopped due to error: %s", e)
+            self._close_automation()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=CONFIG.log_level, format="%(message)s")
+    
     bot = IntegratedTornBot()
     bot.run()
\ No newline at end of file
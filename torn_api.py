@@ -1,21 +1,108 @@
 import os
+import logging
 import time
+import functools
+import asyncio
+import threading
+import aiohttp
+import ijson
+import orjson
 import requests
-from typing import Dict, Any, Optional, List, Union
+from dataclasses import dataclass, field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote, urlencode
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 from dotenv import load_dotenv
+from yarl import URL
 
 # Load environment variables
 load_dotenv()
 
-class TornAPI:
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=64)
+def _join_selections(selections: Tuple[str, ...]) -> str:
+    """Join a selection tuple into the URL-encoded, comma-separated form the API expects"""
+    return quote(",".join(selections), safe=",")
+
+@dataclass(slots=True)
+class UserStatus:
     """
-    A class to interact with the Torn API
+    Flat view of the status fields in a user response
+    """
+    state: str = "okay"
+    energy_current: int = 0
+    energy_maximum: int = 0
+    nerve_current: int = 0
+    nerve_maximum: int = 0
+    happy_current: int = 0
+    happy_maximum: int = 0
+    life_current: int = 0
+    life_maximum: int = 0
+    cooldowns: Dict[str, int] = field(default_factory=dict)
+    notifications: Dict[str, int] = field(default_factory=dict)
+    education_current: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "UserStatus":
+        """
+        Copy the status fields out of a user response
+        
+        Args:
+            data: Response to a user request with the bars, cooldowns and notifications selections
+            
+        Returns:
+            The user's status
+        """
+        bars = data.get("bars", {})
+        energy, nerve, happy, life = (bars.get(key, {}) for key in ("energy", "nerve", "happy", "life"))
+        status = data.get("status")
+        
+        return cls(
+            state=status.get("state", "unknown") if status is not None else "okay",
+            energy_current=energy.get("current", 0),
+            energy_maximum=energy.get("maximum", 0),
+            nerve_current=nerve.get("current", 0),
+            nerve_maximum=nerve.get("maximum", 0),
+            happy_current=happy.get("current", 0),
+            happy_maximum=happy.get("maximum", 0),
+            life_current=life.get("current", 0),
+            life_maximum=life.get("maximum", 0),
+            cooldowns=data.get("cooldowns", {}),
+            notifications=data.get("notifications") or {},
+            education_current=data.get("education_current") or None,
+        )
+
+class _TornAPIBase:
+    """
+    Shared request building, rate limiting and error handling for the Torn API clients
     """
     BASE_URL = "https://api.torn.com"
     
+    # Torn allows 100 requests per minute per key
+    RATE_LIMIT_CAPACITY = 100
+    RATE_LIMIT_PERIOD = 60
+    
+    # Seconds a "section/selection" response stays fresh; unlisted selections are never cached
+    CACHE_TTLS = {
+        "torn/items": 3600,
+        "torn/education": 3600,
+        "torn/gyms": 3600,
+        "user/profile": 300,
+        "user/bars": 15,
+    }
+    # Past its TTL, an entry is still served (and refreshed in the background) up to this many TTLs old
+    CACHE_STALE_FACTOR = 4
+    
+    # Transient server errors are retried with exponential backoff (0.5s, 1s, 2s)
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    
     def __init__(self, api_key: Optional[str] = None):
         """
-        Initialize the TornAPI class
+        Initialize the API client
         
         Args:
             api_key: Torn API key. If not provided, it will be loaded from environment variables
@@ -23,15 +110,137 @@ class TornAPI:
         self.api_key = api_key or os.getenv("TORN_API_KEY")
         if not self.api_key:
             raise ValueError("API key is required. Set it in .env file or pass it to the constructor.")
+        self._base_qs = urlencode({"key": self.api_key})
+        
+        # Token bucket: bursts spend stored tokens, only sustained overage waits
+        self._capacity = self.RATE_LIMIT_CAPACITY
+        self._refill_rate = self.RATE_LIMIT_CAPACITY / self.RATE_LIMIT_PERIOD
+        self._tokens = float(self._capacity)
+        self._last_refill = time.monotonic()
         
-        self.last_request_time = 0
-        self.min_request_interval = int(os.getenv("API_CALL_INTERVAL", "30"))
+        # Response cache: key -> (monotonic timestamp, response, ETag, Last-Modified)
+        self._cache: Dict[Tuple, Tuple[float, Dict[str, Any], Optional[str], Optional[str]]] = {}
     
-    def _make_request(self, section: str, selections: List[str], 
-                     id: Optional[Union[int, str]] = None, 
-                     params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _reserve_token(self) -> float:
+        """
+        Take a token from the rate limit bucket
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
+        
+        # The balance may go negative so concurrent callers queue up behind each other
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0
+        return -self._tokens / self._refill_rate
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get how long to wait before retrying a failed request
+        
+        Args:
+            attempt: Number of the attempt that failed, starting at 0
+            retry_after: Retry-After header of the failed response (optional)
+            
+        Returns:
+            Seconds to wait
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self.RETRY_BACKOFF * 2 ** attempt
+    
+    def _cache_ttl(self, section: str, selections: List[str]) -> float:
+        """
+        Get how long a response may be cached: the shortest TTL of its selections
+        
+        Args:
+            section: API section
+            selections: List of selections to request
+            
+        Returns:
+            TTL in seconds (0 if the response must not be cached)
+        """
+        if not selections:
+            return 0
+        return min(self.CACHE_TTLS.get(f"{section}/{selection}", 0) for selection in selections)
+    
+    def _cache_key(self, section: str, selections: List[str],
+                   id: Optional[Union[int, str]] = None,
+                   params: Optional[Dict[str, Any]] = None) -> Tuple:
+        """Build the cache key for a request"""
+        return (section, id, tuple(sorted(selections)), tuple(sorted((params or {}).items())))
+    
+    def _cache_lookup(self, key: Tuple, ttl: float) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Look up a cached response
+        
+        Args:
+            key: Cache key
+            ttl: TTL in seconds
+            
+        Returns:
+            Tuple of the cached response (None if missing or too old) and whether it is stale
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, False
+        
+        age = time.monotonic() - entry[0]
+        if age < ttl:
+            return entry[1], False
+        if age < ttl * self.CACHE_STALE_FACTOR:
+            return entry[1], True
+        return None, False
+    
+    def _cache_store(self, key: Tuple, data: Dict[str, Any],
+                     etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Cache a response and its validators unless it is an error"""
+        if "error" not in data:
+            self._cache[key] = (time.monotonic(), data, etag, last_modified)
+    
+    def _conditional_headers(self, key: Optional[Tuple]) -> Dict[str, str]:
+        """
+        Build If-None-Match/If-Modified-Since headers from a cached response
+        
+        Args:
+            key: Cache key (None for uncached requests)
+            
+        Returns:
+            Request headers (empty if there is nothing to revalidate)
         """
-        Make a request to the Torn API
+        entry = self._cache.get(key) if key is not None else None
+        headers = {}
+        if entry is not None:
+            _, _, etag, last_modified = entry
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+    
+    def _revalidated(self, key: Tuple) -> Dict[str, Any]:
+        """
+        Mark a cached response as fresh after a 304 Not Modified
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached response
+        """
+        _, data, etag, last_modified = self._cache[key]
+        self._cache[key] = (time.monotonic(), data, etag, last_modified)
+        return data
+    
+    def _build_request(self, section: str, selections: List[str],
+                       id: Optional[Union[int, str]] = None,
+                       params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the full URL, query string included, for a request
         
         Args:
             section: API section (user, property, faction, company, market, torn)
@@ -40,50 +249,37 @@ class TornAPI:
             params: Additional parameters for the request
             
         Returns:
-            API response as a dictionary
+            The request URL
         """
-        # Respect rate limits
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            print(f"Rate limiting: Sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        # Build URL
         url = f"{self.BASE_URL}/{section}"
         if id is not None:
             url += f"/{id}"
         
-        # Prepare parameters
-        request_params = params or {}
-        request_params["key"] = self.api_key
-        request_params["selections"] = ",".join(selections)
+        query = f"{self._base_qs}&selections={_join_selections(tuple(selections))}"
+        if params:
+            # The key and selections always come from this client
+            extra = {name: value for name, value in params.items() if name not in ("key", "selections")}
+            if extra:
+                query = f"{urlencode(extra)}&{query}"
         
-        # Make request
-        try:
-            response = requests.get(url, params=request_params)
-            self.last_request_time = time.time()
-            
-            # Check for errors
-            if response.status_code != 200:
-                print(f"Error: HTTP {response.status_code}")
-                return {"error": {"code": response.status_code, "message": response.text}}
-            
-            data = response.json()
-            
-            # Check for API errors
-            if "error" in data:
-                error_code = data["error"]["code"]
-                error_message = data["error"]["error"]
-                print(f"API Error {error_code}: {error_message}")
-                return data
+        return f"{url}?{query}"
+    
+    def _check_api_error(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report an API error contained in a response
+        
+        Args:
+            data: Decoded API response
             
-            return data
-        except Exception as e:
-            print(f"Request failed: {str(e)}")
-            return {"error": {"code": -1, "message": str(e)}}
+        Returns:
+            The response, unchanged
+        """
+        if "error" in data:
+            error_code = data["error"]["code"]
+            error_message = data["error"]["error"]
+            logger.warning("API Error %s: %s", error_code, error_message)
+        
+        return data
     
     def get_user(self, selections: List[str], user_id: str = "") -> Dict[str, Any]:
         """
@@ -163,7 +359,348 @@ class TornAPI:
         return self._make_request("torn", selections)
 
 
+class TornAPI(_TornAPIBase):
+    """
+    A class to interact with the Torn API
+    """
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the TornAPI class
+        
+        Args:
+            api_key: Torn API key. If not provided, it will be loaded from environment variables
+        """
+        super().__init__(api_key)
+        
+        # Long-lived session so requests reuse the same keep-alive TLS connection;
+        # transient failures are retried on that connection before the error reaches us
+        retry = Retry(
+            total=self.RETRY_TOTAL,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+        
+        # Per-key locks so concurrent misses for the same data make a single request
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._refreshing = set()
+        
+        # The status fetch, the action thread and background refreshes all draw tokens
+        self._bucket_lock = threading.Lock()
+    
+    def close(self):
+        """Close the HTTP session"""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+    
+    def _make_request(self, section: str, selections: List[str], 
+                     id: Optional[Union[int, str]] = None, 
+                     params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Torn API, serving cacheable selections from the cache
+        
+        Args:
+            section: API section (user, property, faction, company, market, torn)
+            selections: List of selections to request
+            id: ID for the request (optional)
+            params: Additional parameters for the request
+            
+        Returns:
+            API response as a dictionary
+        """
+        ttl = self._cache_ttl(section, selections)
+        if not ttl:
+            return self._fetch(section, selections, id, params)
+        
+        key = self._cache_key(section, selections, id, params)
+        data, stale = self._cache_lookup(key, ttl)
+        if data is not None:
+            if stale:
+                self._refresh_in_background(key, section, selections, id, params)
+            return data
+        
+        with self._lock_for(key):
+            # Another thread may have fetched it while we waited for the lock
+            data, _ = self._cache_lookup(key, ttl)
+            if data is None:
+                data = self._fetch(section, selections, id, params, key)
+            return data
+    
+    def _throttle(self):
+        """Sleep as long as the rate limit requires"""
+        with self._bucket_lock:
+            sleep_time = self._reserve_token()
+        if sleep_time > 0:
+            logger.debug("Rate limiting: Sleeping for %.2f seconds", sleep_time)
+            time.sleep(sleep_time)
+    
+    def iter_items(self, section: str, selections: List[str], prefix: str,
+                   id: Optional[Union[int, str]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the entries of one object in a large response without loading
+        the whole body into memory. Responses are not cached.
+        
+        Args:
+            section: API section (user, property, faction, company, market, torn)
+            selections: List of selections to request
+            prefix: Path of the object to stream (e.g. "items")
+            id: ID for the request (optional)
+            
+        Yields:
+            (key, value) pairs of the object; nothing if the request fails
+        """
+        self._throttle()
+        
+        url = self._build_request(section, selections, id)
+        
+        try:
+            with self.session.get(url, stream=True, timeout=(3.05, 15)) as response:
+                if response.status_code != 200:
+                    logger.warning("Error: HTTP %s", response.status_code)
+                    return
+                
+                response.raw.decode_content = True
+                yield from ijson.kvitems(response.raw, prefix, use_float=True)
+        except Exception as e:
+            logger.warning("Request failed: %s", e)
+    
+    def _lock_for(self, key: Tuple) -> threading.Lock:
+        """Get the lock for a cache key"""
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def _refresh_in_background(self, key: Tuple, section: str, selections: List[str],
+                               id: Optional[Union[int, str]] = None,
+                               params: Optional[Dict[str, Any]] = None):
+        """Refresh a stale cache entry on a background thread"""
+        with self._locks_guard:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                with self._lock_for(key):
+                    self._fetch(section, selections, id, params, key)
+            finally:
+                with self._locks_guard:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    def _fetch(self, section: str, selections: List[str], 
+               id: Optional[Union[int, str]] = None, 
+               params: Optional[Dict[str, Any]] = None,
+               key: Optional[Tuple] = None) -> Dict[str, Any]:
+        """
+        Fetch a response from the Torn API
+        
+        Args:
+            section: API section (user, property, faction, company, market, torn)
+            selections: List of selections to request
+            id: ID for the request (optional)
+            params: Additional parameters for the request
+            key: Cache key to revalidate and store the response under (optional)
+            
+        Returns:
+            API response as a dictionary
+        """
+        self._throttle()
+        
+        url = self._build_request(section, selections, id, params)
+        
+        # Make request
+        try:
+            response = self.session.get(url, headers=self._conditional_headers(key), timeout=(3.05, 15))
+            
+            # Unchanged since the cached copy
+            if response.status_code == 304 and key in self._cache:
+                return self._revalidated(key)
+            
+            # Check for errors
+            if response.status_code != 200:
+                logger.warning("Error: HTTP %s", response.status_code)
+                return {"error": {"code": response.status_code, "message": response.text}}
+            
+            data = self._check_api_error(orjson.loads(response.content))
+            if key is not None:
+                self._cache_store(key, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return data
+        except Exception as e:
+            logger.warning("Request failed: %s", e)
+            return {"error": {"code": -1, "message": str(e)}}
+
+
+class AsyncTornAPI(_TornAPIBase):
+    """
+    An asyncio client for the Torn API, so independent selections can be fetched concurrently
+    
+    The get_* methods return coroutines and must be awaited.
+    """
+    
+    # Requests allowed in flight at once; also the size of the connection pool
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the AsyncTornAPI class
+        
+        Args:
+            api_key: Torn API key. If not provided, it will be loaded from environment variables
+        """
+        super().__init__(api_key)
+        
+        # Created on first use, since aiohttp sessions must belong to a running event loop
+        self._session = None
+        
+        # The token bucket bounds the request rate; this bounds how many are in flight
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        # Per-key locks so concurrent misses for the same data make a single request
+        self._locks: Dict[Tuple, asyncio.Lock] = {}
+        self._refresh_tasks: Dict[Tuple, asyncio.Task] = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, creating it if needed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(sock_connect=3.05, sock_read=15),
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+    
+    async def _make_request(self, section: str, selections: List[str],
+                            id: Optional[Union[int, str]] = None,
+                            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Torn API, serving cacheable selections from the cache
+        
+        Args:
+            section: API section (user, property, faction, company, market, torn)
+            selections: List of selections to request
+            id: ID for the request (optional)
+            params: Additional parameters for the request
+            
+        Returns:
+            API response as a dictionary
+        """
+        ttl = self._cache_ttl(section, selections)
+        if not ttl:
+            return await self._fetch(section, selections, id, params)
+        
+        key = self._cache_key(section, selections, id, params)
+        data, stale = self._cache_lookup(key, ttl)
+        if data is not None:
+            if stale and key not in self._refresh_tasks:
+                task = asyncio.create_task(self._refresh(key, section, selections, id, params))
+                self._refresh_tasks[key] = task
+                task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+            return data
+        
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            # Another task may have fetched it while we waited for the lock
+            data, _ = self._cache_lookup(key, ttl)
+            if data is None:
+                data = await self._fetch(section, selections, id, params, key)
+            return data
+    
+    async def _refresh(self, key: Tuple, section: str, selections: List[str],
+                       id: Optional[Union[int, str]] = None,
+                       params: Optional[Dict[str, Any]] = None):
+        """Refresh a stale cache entry"""
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            await self._fetch(section, selections, id, params, key)
+    
+    async def _fetch(self, section: str, selections: List[str],
+                     id: Optional[Union[int, str]] = None,
+                     params: Optional[Dict[str, Any]] = None,
+                     key: Optional[Tuple] = None) -> Dict[str, Any]:
+        """
+        Fetch a response from the Torn API
+        
+        Args:
+            section: API section (user, property, faction, company, market, torn)
+            selections: List of selections to request
+            id: ID for the request (optional)
+            params: Additional parameters for the request
+            key: Cache key to revalidate and store the response under (optional)
+            
+        Returns:
+            API response as a dictionary
+        """
+        # Respect rate limits
+        sleep_time = self._reserve_token()
+        if sleep_time > 0:
+            logger.debug("Rate limiting: Sleeping for %.2f seconds", sleep_time)
+            await asyncio.sleep(sleep_time)
+        
+        # Already encoded, so aiohttp can send it without parsing and quoting it again
+        url = URL(self._build_request(section, selections, id, params), encoded=True)
+        
+        # Make request, retrying transient failures with backoff
+        for attempt in range(self.RETRY_TOTAL + 1):
+            retrying = attempt < self.RETRY_TOTAL
+            try:
+                async with self._semaphore, self._get_session().get(
+                        url, headers=self._conditional_headers(key)) as response:
+                    if response.status not in self.RETRY_STATUSES or not retrying:
+                        return await self._read_response(response, key)
+                    delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not retrying:
+                    logger.warning("Request failed: %s", e)
+                    return {"error": {"code": -1, "message": str(e)}}
+                delay = self._retry_delay(attempt)
+            except Exception as e:
+                logger.warning("Request failed: %s", e)
+                return {"error": {"code": -1, "message": str(e)}}
+            
+            await asyncio.sleep(delay)
+    
+    async def _read_response(self, response: aiohttp.ClientResponse,
+                             key: Optional[Tuple] = None) -> Dict[str, Any]:
+        """
+        Turn a final API response into a result, caching it if a key is given
+        
+        Args:
+            response: Response that will not be retried
+            key: Cache key to revalidate and store the response under (optional)
+            
+        Returns:
+            API response as a dictionary
+        """
+        # Unchanged since the cached copy
+        if response.status == 304 and key in self._cache:
+            return self._revalidated(key)
+        
+        # Check for errors
+        if response.status != 200:
+            logger.warning("Error: HTTP %s", response.status)
+            return {"error": {"code": response.status, "message": await response.text()}}
+        
+        data = self._check_api_error(orjson.loads(await response.read()))
+        if key is not None:
+            self._cache_store(key, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return data
+
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(), format="%(message)s")
+    
     # Example usage
     api = TornAPI()
     
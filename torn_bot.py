@@ -1,17 +1,19 @@
-import os
-import time
+import logging
 import random
-import schedule
+import asyncio
 import json
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
-from torn_api import TornAPI
+from config import CONFIG
+from torn_api import AsyncTornAPI, UserStatus
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class TornBot:
     """
     A bot to automate various activities in Torn
@@ -19,132 +21,137 @@ class TornBot:
     
     def __init__(self):
         """Initialize the TornBot"""
-        self.api = TornAPI()
+        self.api = AsyncTornAPI()
         self.user_id = None
         self.name = None
         
-        # Feature flags
-        self.enable_crimes = self._parse_bool_env("ENABLE_CRIMES", True)
-        self.enable_gym = self._parse_bool_env("ENABLE_GYM", True)
-        self.enable_items = self._parse_bool_env("ENABLE_ITEMS", True)
-        self.enable_education = self._parse_bool_env("ENABLE_EDUCATION", True)
-        self.enable_travel = self._parse_bool_env("ENABLE_TRAVEL", False)
-        
         # Cache for data
         self.cache = {}
         
-        # Initialize user data
-        self._initialize()
-    
-    def _parse_bool_env(self, key: str, default: bool = False) -> bool:
-        """Parse boolean environment variables"""
-        value = os.getenv(key, str(default)).lower()
-        return value in ("true", "1", "t", "yes", "y")
+        # Set by stop() to end the update loop; created once the event loop is running
+        self._stop: Optional[asyncio.Event] = None
+        
+        # Timer for the next status update and the update it is running
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tick_task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
     
-    def _initialize(self):
+    async def _initialize(self):
         """Initialize the bot with user data"""
-        print("Initializing TornBot...")
+        logger.info("Initializing TornBot...")
         
         # Get user profile
-        user_data = self.api.get_user(["profile"])
+        user_data = await self.api.get_user(["profile"])
         if "error" in user_data:
-            print("Failed to initialize bot. Check your API key.")
+            logger.warning("Failed to initialize bot. Check your API key.")
             return
         
         self.user_id = user_data.get("player_id")
         self.name = user_data.get("name")
         
-        print(f"Bot initialized for: {self.name} [{self.user_id}]")
-        print(f"Features enabled:")
-        print(f"  - Crimes: {self.enable_crimes}")
-        print(f"  - Gym: {self.enable_gym}")
-        print(f"  - Items: {self.enable_items}")
-        print(f"  - Education: {self.enable_education}")
-        print(f"  - Travel: {self.enable_travel}")
+        logger.info("Bot initialized for: %s [%s]", self.name, self.user_id)
+        logger.info("Features enabled:")
+        logger.info("  - Crimes: %s", CONFIG.enable_crimes)
+        logger.info("  - Gym: %s", CONFIG.enable_gym)
+        logger.info("  - Items: %s", CONFIG.enable_items)
+        logger.info("  - Education: %s", CONFIG.enable_education)
+        logger.info("  - Travel: %s", CONFIG.enable_travel)
     
-    def update_status(self):
-        """Update and print the current user status"""
-        # Get user data with multiple selections
+    async def update_status(self):
+        """Update and log the current user status"""
+        # Get everything this cycle needs in a single request
         selections = ["profile", "bars", "cooldowns", "notifications"]
-        if self.enable_education:
+        if CONFIG.enable_crimes:
+            selections.append("crimes")
+        if CONFIG.enable_gym:
+            selections.append("gyms")
+        if CONFIG.enable_items:
+            selections.append("inventory")
+        if CONFIG.enable_education:
             selections.append("education")
         
-        user_data = self.api.get_user(selections)
+        user_data = await self.api.get_user(selections)
         if "error" in user_data:
-            print("Failed to update status.")
+            logger.warning("Failed to update status.")
             return
         
-        # Cache the data
+        # Cache the data, with the status fields copied out once
         self.cache["user_data"] = user_data
+        self.cache["status"] = status = UserStatus.from_json(user_data)
         
         # Print status
-        print("\n" + "="*50)
-        print(f"Status update for {self.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*50)
-        
-        # Print bars
-        if "bars" in user_data:
-            bars = user_data["bars"]
-            print(f"Energy: {bars['energy']['current']}/{bars['energy']['maximum']}")
-            print(f"Nerve: {bars['nerve']['current']}/{bars['nerve']['maximum']}")
-            print(f"Happy: {bars['happy']['current']}/{bars['happy']['maximum']}")
-            print(f"Life: {bars['life']['current']}/{bars['life']['maximum']}")
-        
-        # Print cooldowns
-        if "cooldowns" in user_data:
-            cooldowns = user_data["cooldowns"]
-            for name, seconds in cooldowns.items():
-                if seconds > 0:
-                    minutes = seconds // 60
-                    remaining_seconds = seconds % 60
-                    print(f"{name.capitalize()} cooldown: {minutes}m {remaining_seconds}s")
-        
-        # Print notifications
-        if "notifications" in user_data and user_data["notifications"]:
-            print("\nNotifications:")
-            for category, count in user_data["notifications"].items():
-                if count > 0:
-                    print(f"  - {category}: {count}")
-        
-        # Print education status
-        if "education" in user_data and "education_current" in user_data:
-            current = user_data["education_current"]
-            if current:
-                time_left = current.get("time_left", 0)
-                minutes = time_left // 60
-                remaining_seconds = time_left % 60
-                print(f"\nCurrently studying: {current.get('name', 'Unknown')} - {minutes}m {remaining_seconds}s remaining")
-        
-        print("="*50)
+        if logger.isEnabledFor(logging.INFO):
+            self._log_status(status)
         
         # Run actions based on status
         self._run_actions()
     
+    def _log_status(self, status: UserStatus):
+        """
+        Log the status report as a single message
+        
+        Args:
+            status: User status from the latest status update
+        """
+        separator = "=" * 50
+        lines = [
+            separator,
+            f"Status update for {self.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            separator,
+        ]
+        
+        # Bars
+        lines.append(f"Energy: {status.energy_current}/{status.energy_maximum}")
+        lines.append(f"Nerve: {status.nerve_current}/{status.nerve_maximum}")
+        lines.append(f"Happy: {status.happy_current}/{status.happy_maximum}")
+        lines.append(f"Life: {status.life_current}/{status.life_maximum}")
+        
+        # Cooldowns
+        lines.extend(
+            f"{name.capitalize()} cooldown: {minutes}m {remaining_seconds}s"
+            for name, seconds in status.cooldowns.items() if seconds > 0
+            for minutes, remaining_seconds in (divmod(seconds, 60),)
+        )
+        
+        # Notifications
+        if status.notifications:
+            lines.append("\nNotifications:")
+            for category, count in status.notifications.items():
+                if count > 0:
+                    lines.append(f"  - {category}: {count}")
+        
+        # Education status
+        current = status.education_current
+        if current:
+            minutes, remaining_seconds = divmod(current.get("time_left", 0), 60)
+            lines.append(f"\nCurrently studying: {current.get('name', 'Unknown')} - {minutes}m {remaining_seconds}s remaining")
+        
+        lines.append(separator)
+        logger.info("\n".join(lines))
+    
     def _run_actions(self):
         """Run actions based on current status"""
-        if not self.cache.get("user_data"):
-            print("No user data available. Skipping actions.")
+        status = self.cache.get("status")
+        if status is None:
+            logger.warning("No user data available. Skipping actions.")
             return
         
-        user_data = self.cache["user_data"]
-        
         # Check if we can perform actions
-        if "status" in user_data and user_data["status"].get("state") != "okay":
-            state = user_data["status"].get("state", "unknown")
-            print(f"Cannot perform actions. Current state: {state}")
+        if status.state != "okay":
+            logger.warning("Cannot perform actions. Current state: %s", status.state)
             return
         
         # Run enabled actions
-        if self.enable_crimes:
+        if CONFIG.enable_crimes:
             self.do_crimes()
         
-        if self.enable_gym:
+        if CONFIG.enable_gym:
             self.do_gym()
         
-        if self.enable_items:
+        if CONFIG.enable_items:
             self.use_items()
         
-        if self.enable_education:
+        if CONFIG.enable_education:
             self.do_education()
     
     def do_crimes(self):
@@ -153,132 +160,148 @@ class TornBot:
             return
         
         user_data = self.cache["user_data"]
+        nerve_available = self.cache["status"].nerve_current
         
         # Check if we have nerve
-        if "bars" in user_data and user_data["bars"]["nerve"]["current"] > 0:
-            print("\nPerforming crimes...")
-            
-            # Get crime data
-            crime_data = self.api.get_user(["crimes"])
-            if "error" in crime_data:
-                print("Failed to get crime data.")
-                return
+        if nerve_available > 0:
+            logger.info("Performing crimes...")
             
-            # Find the best crime to commit
-            best_crime = None
-            best_success = 0
+            # Find the most successful crime we have enough nerve for; crimes that never
+            # succeed are skipped, and crimes without a nerve cost default to a high value
+            best = max(
+                ((crime_id, crime) for crime_id, crime in user_data.get("crimes", {}).items()
+                 if crime.get("success", 0) > 0 and nerve_available >= crime.get("nerve", 100)),
+                key=lambda item: item[1].get("success", 0),
+                default=None,
+            )
             
-            for crime_id, crime in crime_data.get("crimes", {}).items():
-                success = crime.get("success", 0)
-                nerve = crime.get("nerve", 100)  # Default to high value if not found
-                
-                # Only consider crimes we have enough nerve for
-                if user_data["bars"]["nerve"]["current"] >= nerve:
-                    if success > best_success:
-                        best_success = success
-                        best_crime = crime_id
-            
-            if best_crime:
+            if best is not None:
+                crime_id, crime = best
                 # Commit the crime
-                print(f"Committing crime: {crime_data['crimes'][best_crime]['name']} (Success rate: {best_success}%)")
+                logger.info("Committing crime: %s (Success rate: %s%%)", crime['name'], crime.get('success', 0))
                 # In a real implementation, this would make an API call to commit the crime
                 # Since the Torn API doesn't support this directly, this would require browser automation
-                print("Note: Crime automation requires browser interaction which is not implemented in this API-only bot")
+                logger.info("Note: Crime automation requires browser interaction which is not implemented in this API-only bot")
             else:
-                print("No suitable crimes found.")
+                logger.info("No suitable crimes found.")
         else:
-            print("Not enough nerve to commit crimes.")
+            logger.info("Not enough nerve to commit crimes.")
     
     def do_gym(self):
         """Train at the gym if energy is available"""
         if not self.cache.get("user_data"):
             return
         
-        user_data = self.cache["user_data"]
-        
         # Check if we have energy
-        if "bars" in user_data and user_data["bars"]["energy"]["current"] > 0:
-            print("\nTraining at the gym...")
-            
-            # Get gym data
-            gym_data = self.api.get_user(["gyms"])
-            if "error" in gym_data:
-                print("Failed to get gym data.")
-                return
+        if self.cache["status"].energy_current > 0:
+            logger.info("Training at the gym...")
             
             # Find the best gym to train at
             # In a real implementation, this would make an API call to train at the gym
             # Since the Torn API doesn't support this directly, this would require browser automation
-            print("Note: Gym automation requires browser interaction which is not implemented in this API-only bot")
+            logger.info("Note: Gym automation requires browser interaction which is not implemented in this API-only bot")
         else:
-            print("Not enough energy to train at the gym.")
+            logger.info("Not enough energy to train at the gym.")
     
     def use_items(self):
         """Use items from inventory"""
-        print("\nChecking inventory for usable items...")
-        
-        # Get inventory data
-        inventory_data = self.api.get_user(["inventory"])
-        if "error" in inventory_data:
-            print("Failed to get inventory data.")
+        if not self.cache.get("user_data"):
             return
         
+        logger.info("Checking inventory for usable items...")
+        
         # Check for energy drinks, etc.
         # In a real implementation, this would make an API call to use items
         # Since the Torn API doesn't support this directly, this would require browser automation
-        print("Note: Item usage requires browser interaction which is not implemented in this API-only bot")
+        logger.info("Note: Item usage requires browser interaction which is not implemented in this API-only bot")
     
     def do_education(self):
         """Start education courses if not currently studying"""
         if not self.cache.get("user_data"):
             return
         
-        user_data = self.cache["user_data"]
-        
         # Check if we're already studying
-        if "education_current" in user_data and user_data["education_current"]:
-            print("Already studying a course.")
+        if self.cache["status"].education_current:
+            logger.info("Already studying a course.")
             return
         
-        print("\nChecking for education courses...")
-        
-        # Get education data
-        if "education" not in user_data:
-            education_data = self.api.get_user(["education"])
-            if "error" in education_data:
-                print("Failed to get education data.")
-                return
-            user_data["education"] = education_data.get("education", {})
+        logger.info("Checking for education courses...")
         
         # Find a suitable course
         # In a real implementation, this would make an API call to start a course
         # Since the Torn API doesn't support this directly, this would require browser automation
-        print("Note: Education automation requires browser interaction which is not implemented in this API-only bot")
+        logger.info("Note: Education automation requires browser interaction which is not implemented in this API-only bot")
     
-    def run(self):
-        """Run the bot"""
-        print("Starting TornBot...")
+    def _tick(self, deadline: float):
+        """
+        Timer callback: start a status update due at the given deadline
+        
+        Args:
+            deadline: Event loop time the update was scheduled for
+        """
+        self._tick_task = asyncio.ensure_future(self._update_and_reschedule(deadline))
+    
+    async def _update_and_reschedule(self, deadline: float):
+        """
+        Update status, then arm the timer for the next update
         
-        # Update status immediately
-        self.update_status()
+        Args:
+            deadline: Event loop time this update was scheduled for
+        """
+        try:
+            await self.update_status()
+        except Exception as e:
+            # Hand the error to _run_loop, which stops the bot with it
+            self._error = e
+            self._stop.set()
+            return
         
-        # Schedule status updates
-        interval = int(os.getenv("API_CALL_INTERVAL", "60"))
-        print(f"Scheduling status updates every {interval} seconds")
+        if not self._stop.is_set():
+            # Deadlines advance by a whole interval so slow updates don't drift the schedule,
+            # but an update that overran its interval is not followed by a burst of catch-up ticks
+            loop = asyncio.get_running_loop()
+            next_deadline = max(deadline + CONFIG.api_call_interval, loop.time())
+            self._timer = loop.call_at(next_deadline, self._tick, next_deadline)
+    
+    async def _run_loop(self):
+        """Initialize the bot and update status on a fixed interval"""
+        self._stop = asyncio.Event()
+        await self._initialize()
         
-        schedule.every(interval).seconds.do(self.update_status)
+        try:
+            logger.info("Scheduling status updates every %s seconds", CONFIG.api_call_interval)
+            
+            # Each update arms the timer for the next one; we just wait to be stopped
+            self._tick(asyncio.get_running_loop().time())
+            await self._stop.wait()
+            if self._error is not None:
+                raise self._error
+        finally:
+            if self._timer is not None:
+                self._timer.cancel()
+            if self._tick_task is not None and not self._tick_task.done():
+                await asyncio.gather(self._tick_task, return_exceptions=True)
+            await self.api.close()
+    
+    def stop(self):
+        """Stop the bot after the current update finishes"""
+        if self._stop is not None:
+            self._stop.set()
+    
+    def run(self):
+        """Run the bot"""
+        logger.info("Starting TornBot...")
         
-        # Run the scheduler
+        # Run the event loop
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(1)
+            asyncio.run(self._run_loop())
         except KeyboardInterrupt:
-            print("\nBot stopped by user.")
+            logger.info("Bot stopped by user.")
         except Exception as e:
-            print(f"\nBot stopped due to error: {str(e)}")
-
+            logger.error("Bot stopped due to error: %s", e)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=CONFIG.log_level, format="%(message)s")
+    
     bot = TornBot()
     bot.run()
\ No newline at end of file